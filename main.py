@@ -6,6 +6,7 @@ import pandas as pd
 from tqdm import tqdm
 from indicators import IndicatorCalculator
 from report_generator import ReportGenerator
+from score_history import ScoreHistory
 import config
 import time
 import os
@@ -14,6 +15,7 @@ logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s: %(mes
 logger = logging.getLogger()
 
 DATA_CACHE_DIR = 'data_cache'
+SCORE_HISTORY_DIR = 'score_history'
 TIME_SLEEP = 0
 
 
@@ -155,6 +157,11 @@ def main():
     master_rankings = sorted(master_rankings, key=lambda x: float(x['Master_Score']), reverse=True)
 
     report_generator.generate_report(all_results, master_rankings)
+
+    try:
+        ScoreHistory(SCORE_HISTORY_DIR).record_run(all_results, master_rankings)
+    except Exception as e:
+        logger.error(f"Failed to record run in score history: {e}")
     logger.info("Analysis complete. Program finished.")
 
 
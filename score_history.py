@@ -0,0 +1,182 @@
+# score_history.py
+
+import os
+import logging
+import pandas as pd
+from datetime import datetime
+
+RUN_ID_FORMAT = "%Y%m%d-%H%M%S"
+
+TIMEFRAME_TABLE = 'timeframe_results'
+MASTER_TABLE = 'master_rankings'
+
+# Columns produced by IndicatorCalculator/main.py as formatted strings that are stored as floats.
+NUMERIC_COLUMNS = [
+    'Close_Price', 'RSI', 'MACD_Hist', 'ATR', 'OBV', 'SMA_50', 'SMA_200',
+    'Trend_Score', 'Momentum_Score', 'Final_Score',
+    'Short_Term_Score', 'Medium_Term_Score', 'Long_Term_Score', 'Master_Score',
+]
+
+
+class ScoreHistory:
+    """
+    Append-only Parquet store of every run's per-timeframe results and master rankings.
+
+    Layout (hive-style, partitioned by run date, one immutable file per run):
+        <root>/timeframe_results/run_date=YYYY-MM-DD/run_<run_id>.parquet
+        <root>/master_rankings/run_date=YYYY-MM-DD/run_<run_id>.parquet
+
+    Rows inside each file are sorted by Ticker so per-ticker filters can skip row groups.
+    """
+
+    def __init__(self, root='score_history'):
+        self.root = root
+
+    def _table_dir(self, table):
+        return os.path.join(self.root, table)
+
+    def _run_files(self, table):
+        """Returns {run_id: path} for a table, found from file names only (no data is read)."""
+        runs = {}
+        table_dir = self._table_dir(table)
+        if not os.path.isdir(table_dir):
+            return runs
+        for partition in os.listdir(table_dir):
+            if not partition.startswith('run_date='):
+                continue
+            partition_dir = os.path.join(table_dir, partition)
+            for name in os.listdir(partition_dir):
+                if name.startswith('run_') and name.endswith('.parquet'):
+                    runs[name[len('run_'):-len('.parquet')]] = os.path.join(partition_dir, name)
+        return dict(sorted(runs.items()))
+
+    def _write_partition(self, table, df, run_time, run_id):
+        partition_dir = os.path.join(self._table_dir(table), f"run_date={run_time.strftime('%Y-%m-%d')}")
+        os.makedirs(partition_dir, exist_ok=True)
+        path = os.path.join(partition_dir, f"run_{run_id}.parquet")
+        if os.path.exists(path):
+            raise FileExistsError(f"Score history already contains run {run_id} for {table}.")
+
+        # Write to a temp file first so readers never see a half-written run.
+        tmp_path = path + '.tmp'
+        df.sort_values('Ticker').to_parquet(tmp_path, index=False)
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def _to_numeric(df):
+        for col in NUMERIC_COLUMNS:
+            if col in df.columns:
+                df[col] = pd.to_numeric(df[col], errors='coerce').astype('float64')
+        return df
+
+    def record_run(self, all_results, master_rankings, run_time=None):
+        """
+        Appends one run's results to the history and returns its run id.
+        all_results and master_rankings have the same shape as passed to ReportGenerator.
+        """
+        run_time = run_time or datetime.now()
+        run_id = run_time.strftime(RUN_ID_FORMAT)
+
+        frames = []
+        for timeframe_name, results in all_results.items():
+            if not results:
+                continue
+            df = pd.DataFrame(results)
+            df.insert(0, 'Timeframe', timeframe_name)
+            frames.append(df)
+
+        if frames:
+            timeframe_df = self._to_numeric(pd.concat(frames, ignore_index=True))
+            timeframe_df.insert(0, 'Run_Id', run_id)
+            timeframe_df = timeframe_df.astype({col: 'string' for col in timeframe_df.columns
+                                                if timeframe_df[col].dtype == object})
+            self._write_partition(TIMEFRAME_TABLE, timeframe_df, run_time, run_id)
+
+        if master_rankings:
+            master_df = self._to_numeric(pd.DataFrame(master_rankings))
+            master_df['Rank'] = master_df['Master_Score'].rank(method='min', ascending=False).astype('int64')
+            master_df.insert(0, 'Run_Id', run_id)
+            master_df = master_df.astype({'Run_Id': 'string', 'Ticker': 'string'})
+            self._write_partition(MASTER_TABLE, master_df, run_time, run_id)
+
+        logging.info(f"Recorded run {run_id} in score history at '{self.root}'.")
+        return run_id
+
+    def list_runs(self):
+        """Returns the ids of all recorded runs, oldest first."""
+        return list(self._run_files(MASTER_TABLE))
+
+    def _read(self, table, run_ids, columns=None, filters=None):
+        files = self._run_files(table)
+        paths = [files[run_id] for run_id in run_ids if run_id in files]
+        if not paths:
+            return pd.DataFrame(columns=columns)
+
+        # A single read over all files lets pyarrow scan them in parallel and prune by Ticker stats.
+        return pd.read_parquet(paths, columns=columns, filters=filters)
+
+    def get_score_series(self, ticker, column='Master_Score', timeframe=None, last_n_runs=None):
+        """
+        Returns a Series of `column` for one ticker indexed by run time, oldest first.
+        Master ranking columns (Master_Score, Rank, ...) are read when timeframe is None,
+        otherwise the column is read from that timeframe's results (e.g. Final_Score).
+        """
+        table = MASTER_TABLE if timeframe is None else TIMEFRAME_TABLE
+        run_ids = list(self._run_files(table))
+        if last_n_runs is not None:
+            run_ids = run_ids[-last_n_runs:]
+
+        filters = [('Ticker', '==', ticker)]
+        if timeframe is not None:
+            filters.append(('Timeframe', '==', timeframe))
+
+        df = self._read(table, run_ids, columns=['Run_Id', column], filters=filters)
+        index = pd.to_datetime(df['Run_Id'].astype(str), format=RUN_ID_FORMAT).rename('Run_Time')
+        return pd.Series(df[column].to_numpy(), index=index, name=column)
+
+    def get_rank_movers(self, top_n=10, run_id=None):
+        """
+        Compares master rankings of a run (latest by default) with the run before it.
+        Returns a DataFrame sorted by absolute rank change, where positive Rank_Change means
+        the ticker moved up. Tickers new to the run have no previous rank and are excluded.
+        """
+        run_ids = self.list_runs()
+        if run_id is not None:
+            run_ids = [r for r in run_ids if r <= run_id]
+        if len(run_ids) < 2:
+            logging.warning("Score history needs at least two runs to compute rank movers.")
+            return pd.DataFrame(columns=['Ticker', 'Previous_Rank', 'Rank', 'Rank_Change',
+                                         'Previous_Master_Score', 'Master_Score'])
+
+        previous_id, current_id = run_ids[-2], run_ids[-1]
+        columns = ['Ticker', 'Rank', 'Master_Score']
+        previous = self._read(MASTER_TABLE, [previous_id], columns=columns)
+        current = self._read(MASTER_TABLE, [current_id], columns=columns)
+
+        movers = current.merge(previous, on='Ticker', suffixes=('', '_prev'))
+        movers = movers.rename(columns={'Rank_prev': 'Previous_Rank',
+                                        'Master_Score_prev': 'Previous_Master_Score'})
+        movers['Rank_Change'] = movers['Previous_Rank'] - movers['Rank']
+        movers = movers.loc[movers['Rank_Change'].abs().sort_values(ascending=False, kind='stable').index]
+        movers = movers[['Ticker', 'Previous_Rank', 'Rank', 'Rank_Change',
+                         'Previous_Master_Score', 'Master_Score']]
+        return movers.head(top_n).reset_index(drop=True)
+
+    def get_snapshot(self, as_of=None, timeframe=None):
+        """
+        Returns the most recent run recorded at or before `as_of` (a datetime or anything
+        pd.Timestamp accepts; defaults to now). Master rankings are returned when timeframe
+        is None, otherwise that timeframe's per-ticker results.
+        """
+        table = MASTER_TABLE if timeframe is None else TIMEFRAME_TABLE
+        cutoff = pd.Timestamp(as_of) if as_of is not None else pd.Timestamp.now()
+        run_ids = [r for r in self._run_files(table)
+                   if pd.Timestamp(datetime.strptime(r, RUN_ID_FORMAT)) <= cutoff]
+        if not run_ids:
+            logging.warning(f"No runs recorded in score history at or before {cutoff}.")
+            return pd.DataFrame()
+
+        filters = [('Timeframe', '==', timeframe)] if timeframe is not None else None
+        df = self._read(table, run_ids[-1:], filters=filters)
+        sort_by = 'Rank' if timeframe is None else 'Ticker'
+        return df.drop(columns='run_date', errors='ignore').sort_values(sort_by).set_index('Ticker')